@@ -135,6 +135,11 @@ class DefaultAgent(AbstractConversationAgent):
             self._async_handle_area_registry_changed,
             run_immediately=True,
         )
+        self.hass.bus.async_listen(
+            ar.EVENT_AREA_REGISTRY_UPDATED_BULK,
+            self._async_handle_area_registry_changed,
+            run_immediately=True,
+        )
         self.hass.bus.async_listen(
             er.EVENT_ENTITY_REGISTRY_UPDATED,
             self._async_handle_entity_registry_changed,
@@ -24,7 +24,10 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
     EVENT_THEMES_UPDATED,
 )
-from homeassistant.helpers.area_registry import EVENT_AREA_REGISTRY_UPDATED
+from homeassistant.helpers.area_registry import (
+    EVENT_AREA_REGISTRY_UPDATED,
+    EVENT_AREA_REGISTRY_UPDATED_BULK,
+)
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 
@@ -32,6 +35,7 @@ from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 # Except for state_changed, which is handled accordingly.
 SUBSCRIBE_ALLOWLIST: Final[set[str]] = {
     EVENT_AREA_REGISTRY_UPDATED,
+    EVENT_AREA_REGISTRY_UPDATED_BULK,
     EVENT_COMPONENT_LOADED,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1,8 +1,9 @@
 """Provide a way to connect devices to one physical location."""
 from __future__ import annotations
 
-from collections import OrderedDict
-from collections.abc import Container, Iterable, MutableMapping
+from collections.abc import Container, Generator, Iterable
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, cast
 
 import attr
@@ -16,6 +17,7 @@ from .typing import UNDEFINED, UndefinedType
 
 DATA_REGISTRY = "area_registry"
 EVENT_AREA_REGISTRY_UPDATED = "area_registry_updated"
+EVENT_AREA_REGISTRY_UPDATED_BULK = "area_registry_updated_bulk"
 STORAGE_KEY = "core.area_registry"
 STORAGE_VERSION_MAJOR = 1
 STORAGE_VERSION_MINOR = 3
@@ -77,7 +79,7 @@ class AreaRegistry:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the area registry."""
         self.hass = hass
-        self.areas: MutableMapping[str, AreaEntry] = {}
+        self.areas: dict[str, AreaEntry] = {}
         self._store = AreaRegistryStore(
             hass,
             STORAGE_VERSION_MAJOR,
@@ -86,6 +88,9 @@ class AreaRegistry:
             minor_version=STORAGE_VERSION_MINOR,
         )
         self._normalized_name_area_idx: dict[str, str] = {}
+        self._area_data: dict[str, dict[str, Any]] = {}
+        self._bulk_changes: list[dict[str, str]] | None = None
+        self._save_pending = False
 
     @callback
     def async_get_area(self, area_id: str) -> AreaEntry | None:
@@ -95,10 +100,16 @@ class AreaRegistry:
     @callback
     def async_get_area_by_name(self, name: str) -> AreaEntry | None:
         """Get area by name."""
-        normalized_name = normalize_area_name(name)
-        if normalized_name not in self._normalized_name_area_idx:
+        return self._async_get_area_by_normalized_name(normalize_area_name(name))
+
+    @callback
+    def _async_get_area_by_normalized_name(
+        self, normalized_name: str
+    ) -> AreaEntry | None:
+        """Get area by normalized name."""
+        if (area_id := self._normalized_name_area_idx.get(normalized_name)) is None:
             return None
-        return self.areas[self._normalized_name_area_idx[normalized_name]]
+        return self.areas[area_id]
 
     @callback
     def async_list_areas(self) -> Iterable[AreaEntry]:
@@ -108,9 +119,10 @@ class AreaRegistry:
     @callback
     def async_get_or_create(self, name: str) -> AreaEntry:
         """Get or create an area."""
-        if area := self.async_get_area_by_name(name):
+        normalized_name = normalize_area_name(name)
+        if area := self._async_get_area_by_normalized_name(normalized_name):
             return area
-        return self.async_create(name)
+        return self._async_create(name, normalized_name)
 
     @callback
     def async_create(
@@ -123,9 +135,23 @@ class AreaRegistry:
         """Create a new area."""
         normalized_name = normalize_area_name(name)
 
-        if self.async_get_area_by_name(name):
+        if self._async_get_area_by_normalized_name(normalized_name):
             raise ValueError(f"The name {name} ({normalized_name}) is already in use")
 
+        return self._async_create(
+            name, normalized_name, aliases=aliases, picture=picture
+        )
+
+    @callback
+    def _async_create(
+        self,
+        name: str,
+        normalized_name: str,
+        *,
+        aliases: set[str] | None = None,
+        picture: str | None = None,
+    ) -> AreaEntry:
+        """Create a new area, the caller must ensure the name is not in use."""
         area = AreaEntry(
             aliases=aliases, name=name, normalized_name=normalized_name, picture=picture
         )
@@ -133,12 +159,39 @@ class AreaRegistry:
         assert area.id is not None
         self.areas[area.id] = area
         self._normalized_name_area_idx[normalized_name] = area.id
+        self._area_data[area.id] = _area_entry_to_dict(area)
         self.async_schedule_save()
-        self.hass.bus.async_fire(
-            EVENT_AREA_REGISTRY_UPDATED, {"action": "create", "area_id": area.id}
-        )
+        self._async_fire_updated("create", area.id)
         return area
 
+    @callback
+    def async_create_many(self, areas: Iterable[dict[str, Any]]) -> list[AreaEntry]:
+        """Create multiple new areas.
+
+        Each item holds the keyword arguments of async_create. No area is created
+        if any of the names is already in use or repeated within the items.
+        """
+        to_create: list[tuple[dict[str, Any], str]] = []
+        normalized_names: set[str] = set()
+
+        for area in areas:
+            name = area["name"]
+            normalized_name = normalize_area_name(name)
+            if normalized_name in normalized_names or (
+                self._async_get_area_by_normalized_name(normalized_name)
+            ):
+                raise ValueError(
+                    f"The name {name} ({normalized_name}) is already in use"
+                )
+            normalized_names.add(normalized_name)
+            to_create.append((area, normalized_name))
+
+        with self.async_bulk_update():
+            return [
+                self._async_create(normalized_name=normalized_name, **area)
+                for area, normalized_name in to_create
+            ]
+
     @callback
     def async_delete(self, area_id: str) -> None:
         """Delete area."""
@@ -150,10 +203,9 @@ class AreaRegistry:
 
         del self.areas[area_id]
         del self._normalized_name_area_idx[area.normalized_name]
+        del self._area_data[area_id]
 
-        self.hass.bus.async_fire(
-            EVENT_AREA_REGISTRY_UPDATED, {"action": "remove", "area_id": area_id}
-        )
+        self._async_fire_updated("remove", area_id)
 
         self.async_schedule_save()
 
@@ -170,9 +222,7 @@ class AreaRegistry:
         updated = self._async_update(
             area_id, aliases=aliases, name=name, picture=picture
         )
-        self.hass.bus.async_fire(
-            EVENT_AREA_REGISTRY_UPDATED, {"action": "update", "area_id": area_id}
-        )
+        self._async_fire_updated("update", area_id)
         return updated
 
     @callback
@@ -201,8 +251,9 @@ class AreaRegistry:
         if name is not UNDEFINED and name != old.name:
             normalized_name = normalize_area_name(name)
 
-            if normalized_name != old.normalized_name and self.async_get_area_by_name(
-                name
+            if (
+                normalized_name != old.normalized_name
+                and self._async_get_area_by_normalized_name(normalized_name)
             ):
                 raise ValueError(
                     f"The name {name} ({normalized_name}) is already in use"
@@ -215,7 +266,8 @@ class AreaRegistry:
             return old
 
         new = self.areas[area_id] = attr.evolve(old, **new_values)  # type: ignore[arg-type]
-        if normalized_name is not None:
+        self._area_data[area_id] = _area_entry_to_dict(new)
+        if normalized_name is not None and normalized_name != old.normalized_name:
             self._normalized_name_area_idx[
                 normalized_name
             ] = self._normalized_name_area_idx.pop(old.normalized_name)
@@ -223,48 +275,88 @@ class AreaRegistry:
         self.async_schedule_save()
         return new
 
+    @callback
+    @contextmanager
+    def async_bulk_update(self) -> Generator[None, None, None]:
+        """Coalesce the events and saves of changes made within the block.
+
+        The block must not await.
+        """
+        if self._bulk_changes is not None:
+            yield
+            return
+
+        items: list[dict[str, str]] = []
+        self._bulk_changes = items
+        try:
+            yield
+        finally:
+            self._bulk_changes = None
+            if items:
+                self.async_schedule_save()
+                self.hass.bus.async_fire(
+                    EVENT_AREA_REGISTRY_UPDATED_BULK, {"items": items}
+                )
+
+    @callback
+    def _async_fire_updated(self, action: str, area_id: str) -> None:
+        """Fire an area registry updated event, unless in a bulk update."""
+        data = {"action": action, "area_id": area_id}
+        if self._bulk_changes is not None:
+            self._bulk_changes.append(data)
+            return
+        self.hass.bus.async_fire(EVENT_AREA_REGISTRY_UPDATED, data)
+
     async def async_load(self) -> None:
         """Load the area registry."""
         data = await self._store.async_load()
 
-        areas: MutableMapping[str, AreaEntry] = OrderedDict()
+        areas: dict[str, AreaEntry] = {}
 
         if data is not None:
             for area in data["areas"]:
                 assert area["name"] is not None and area["id"] is not None
                 normalized_name = normalize_area_name(area["name"])
-                areas[area["id"]] = AreaEntry(
-                    aliases=set(area["aliases"]),
-                    id=area["id"],
-                    name=area["name"],
-                    normalized_name=normalized_name,
-                    picture=area["picture"],
+                # Positional arguments follow the AreaEntry field order
+                areas[area["id"]] = area_entry = AreaEntry(
+                    area["name"],
+                    normalized_name,
+                    set(area["aliases"]),
+                    area["id"],
+                    area["picture"],
                 )
                 self._normalized_name_area_idx[normalized_name] = area["id"]
+                self._area_data[area["id"]] = _area_entry_to_dict(area_entry)
 
         self.areas = areas
 
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the area registry."""
+        if self._bulk_changes is not None:
+            # Saved once when the bulk update ends
+            return
+        if self._save_pending:
+            # The pending write will pick up this change
+            return
+        self._save_pending = True
         self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
     @callback
     def _data_to_save(self) -> dict[str, list[dict[str, Any]]]:
         """Return data of area registry to store in a file."""
-        data = {}
+        self._save_pending = False
+        return {"areas": list(self._area_data.values())}
 
-        data["areas"] = [
-            {
-                "aliases": list(entry.aliases),
-                "name": entry.name,
-                "id": entry.id,
-                "picture": entry.picture,
-            }
-            for entry in self.areas.values()
-        ]
 
-        return data
+def _area_entry_to_dict(entry: AreaEntry) -> dict[str, Any]:
+    """Return the storage representation of an area entry."""
+    return {
+        "aliases": list(entry.aliases),
+        "name": entry.name,
+        "id": entry.id,
+        "picture": entry.picture,
+    }
 
 
 @callback
@@ -280,6 +372,7 @@ async def async_load(hass: HomeAssistant) -> None:
     await hass.data[DATA_REGISTRY].async_load()
 
 
+@lru_cache(maxsize=1024)
 def normalize_area_name(area_name: str) -> str:
     """Normalize an area name by removing whitespace and case folding."""
     return area_name.casefold().replace(" ", "")
@@ -523,6 +523,10 @@ def mock_area_registry(
     """
     registry = ar.AreaRegistry(hass)
     registry.areas = mock_entries or OrderedDict()
+    registry._area_data = {
+        area_id: ar._area_entry_to_dict(entry)
+        for area_id, entry in registry.areas.items()
+    }
 
     hass.data[ar.DATA_REGISTRY] = registry
     return registry
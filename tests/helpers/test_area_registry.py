@@ -1,5 +1,6 @@
 """Tests for the Area Registry."""
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -23,6 +24,20 @@ def update_events(hass):
     return events
 
 
+@pytest.fixture
+def bulk_update_events(hass):
+    """Capture bulk update events."""
+    events = []
+
+    @callback
+    def async_capture(event):
+        events.append(event.data)
+
+    hass.bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED_BULK, async_capture)
+
+    return events
+
+
 async def test_list_areas(area_registry: ar.AreaRegistry) -> None:
     """Make sure that we can read areas."""
     area_registry.async_create("mock")
@@ -88,6 +103,75 @@ async def test_create_area_with_name_already_in_use(
     assert len(update_events) == 1
 
 
+async def test_create_many_areas(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    hass_storage: dict[str, Any],
+    update_events,
+    bulk_update_events,
+) -> None:
+    """Make sure that we can create multiple areas at once."""
+    area1, area2 = area_registry.async_create_many(
+        [{"name": "mock1"}, {"name": "mock2", "picture": "/image/example.png"}]
+    )
+
+    assert area1 == ar.AreaEntry(
+        name="mock1", normalized_name="mock1", aliases=set(), id=ANY, picture=None
+    )
+    assert area2 == ar.AreaEntry(
+        name="mock2",
+        normalized_name="mock2",
+        aliases=set(),
+        id=ANY,
+        picture="/image/example.png",
+    )
+    assert len(area_registry.areas) == 2
+
+    await hass.async_block_till_done()
+
+    assert len(update_events) == 0
+    assert len(bulk_update_events) == 1
+    assert bulk_update_events[0] == {
+        "items": [
+            {"action": "create", "area_id": area1.id},
+            {"action": "create", "area_id": area2.id},
+        ],
+    }
+
+    await flush_store(area_registry._store)
+    assert len(hass_storage[ar.STORAGE_KEY]["data"]["areas"]) == 2
+
+
+@pytest.mark.parametrize("duplicate", ["existing", "Mock 1"])
+async def test_create_many_areas_with_name_already_in_use(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    update_events,
+    bulk_update_events,
+    duplicate: str,
+) -> None:
+    """Make sure that no area is created if any name is already in use."""
+    area_registry.async_create("existing")
+    await hass.async_block_till_done()
+
+    store = area_registry._store
+    await flush_store(store)
+    with patch.object(store, "async_delay_save") as mock_delay_save, pytest.raises(
+        ValueError
+    ):
+        area_registry.async_create_many(
+            [{"name": "mock1"}, {"name": duplicate}, {"name": "mock3"}]
+        )
+
+    await hass.async_block_till_done()
+
+    assert list(area_registry.areas) == ["existing"]
+    assert area_registry.async_get_area_by_name("mock1") is None
+    assert len(update_events) == 1
+    assert len(bulk_update_events) == 0
+    assert len(mock_delay_save.mock_calls) == 0
+
+
 async def test_create_area_with_id_already_in_use(
     area_registry: ar.AreaRegistry,
 ) -> None:
@@ -120,6 +204,35 @@ async def test_delete_area(
     assert update_events[1]["area_id"] == area.id
 
 
+async def test_bulk_update(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    update_events,
+    bulk_update_events,
+) -> None:
+    """Make sure that changes in a bulk update fire a single event."""
+    area1 = area_registry.async_create("mock1")
+
+    with area_registry.async_bulk_update():
+        area2 = area_registry.async_create("mock2")
+        with area_registry.async_bulk_update():
+            area_registry.async_update(area1.id, name="mock3")
+        area_registry.async_delete(area1.id)
+
+    await hass.async_block_till_done()
+
+    assert len(update_events) == 1
+    assert update_events[0] == {"action": "create", "area_id": area1.id}
+    assert len(bulk_update_events) == 1
+    assert bulk_update_events[0] == {
+        "items": [
+            {"action": "create", "area_id": area2.id},
+            {"action": "update", "area_id": area1.id},
+            {"action": "remove", "area_id": area1.id},
+        ],
+    }
+
+
 async def test_delete_non_existing_area(area_registry: ar.AreaRegistry) -> None:
     """Make sure that we can't delete an area that doesn't exist."""
     area_registry.async_create("mock")
@@ -237,6 +350,47 @@ async def test_load_area(hass: HomeAssistant, area_registry: ar.AreaRegistry) ->
     assert area2_registry2.id == area2.id
 
 
+async def test_save_area_after_update_and_delete(
+    hass: HomeAssistant, area_registry: ar.AreaRegistry, hass_storage: dict[str, Any]
+) -> None:
+    """Make sure that updated and deleted areas are reflected in stored data."""
+    area1 = area_registry.async_create("mock1")
+    area2 = area_registry.async_create("mock2")
+
+    area_registry.async_update(area1.id, aliases={"alias_1"}, picture="blah")
+    area_registry.async_delete(area2.id)
+
+    await flush_store(area_registry._store)
+    assert hass_storage[ar.STORAGE_KEY]["data"] == {
+        "areas": [
+            {"aliases": ["alias_1"], "id": area1.id, "name": "mock1", "picture": "blah"}
+        ]
+    }
+
+
+async def test_save_not_rescheduled_while_pending(
+    hass: HomeAssistant, area_registry: ar.AreaRegistry, hass_storage: dict[str, Any]
+) -> None:
+    """Make sure that changes do not reschedule a pending save."""
+    store = area_registry._store
+    with patch.object(
+        store, "async_delay_save", wraps=store.async_delay_save
+    ) as mock_delay_save:
+        area1 = area_registry.async_create("mock1")
+        area_registry.async_update(area1.id, picture="blah")
+        area_registry.async_create("mock2")
+        assert len(mock_delay_save.mock_calls) == 1
+
+        await flush_store(store)
+        assert len(hass_storage[ar.STORAGE_KEY]["data"]["areas"]) == 2
+
+        area_registry.async_delete(area1.id)
+        assert len(mock_delay_save.mock_calls) == 2
+
+        await flush_store(store)
+        assert len(hass_storage[ar.STORAGE_KEY]["data"]["areas"]) == 1
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_loading_area_from_storage(
     hass: HomeAssistant, hass_storage: dict[str, Any]
@@ -263,6 +417,51 @@ async def test_loading_area_from_storage(
     assert len(registry.areas) == 1
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_save_area_loaded_from_storage(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Make sure that loaded areas are kept when saving after a change."""
+    hass_storage[ar.STORAGE_KEY] = {
+        "version": ar.STORAGE_VERSION_MAJOR,
+        "minor_version": ar.STORAGE_VERSION_MINOR,
+        "data": {
+            "areas": [
+                {
+                    "aliases": ["alias_1"],
+                    "id": "12345A",
+                    "name": "mock",
+                    "picture": "blah",
+                }
+            ]
+        },
+    }
+
+    await ar.async_load(hass)
+    registry = ar.async_get(hass)
+
+    area = registry.async_create("mock2")
+    registry.async_update(area.id, picture="/image/example.png")
+
+    await flush_store(registry._store)
+    assert hass_storage[ar.STORAGE_KEY]["data"] == {
+        "areas": [
+            {
+                "aliases": ["alias_1"],
+                "id": "12345A",
+                "name": "mock",
+                "picture": "blah",
+            },
+            {
+                "aliases": [],
+                "id": area.id,
+                "name": "mock2",
+                "picture": "/image/example.png",
+            },
+        ]
+    }
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_migration_from_1_1(
     hass: HomeAssistant, hass_storage: dict[str, Any]